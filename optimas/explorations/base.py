@@ -194,8 +194,11 @@ class Exploration:
         if self._n_evals > 0:
             self.libE_specs["reuse_output_dir"] = True
 
-        # Get gen_specs and sim_specs.
+        # Get gen_specs and sim_specs. The generator is part of the gen_specs,
+        # which are sent to the libEnsemble workers. Prepare it to reduce
+        # the amount of data that needs to be sent.
         run_params = self.evaluator.get_run_params()
+        self.generator._prepare_to_send()
         gen_specs = self.generator.get_gen_specs(
             self.sim_workers, run_params, sim_max
         )
@@ -62,6 +62,10 @@ def persistent_generator(H, persis_info, gen_specs, libE_info):
     n_gens = 0
     n_failed_gens = 0
 
+    # Allow the generator to save the model in the background, so that
+    # writing it to file does not stall the exploration.
+    generator._save_model_in_background = True
+
     # Receive information from the manager (or a STOP_TAG)
     tag = None
     while tag not in [STOP_TAG, PERSIS_STOP]:
@@ -115,4 +119,8 @@ def persistent_generator(H, persis_info, gen_specs, libE_info):
         else:
             number_of_gen_points = 0
 
+    # Make sure that the last model has been saved before finishing.
+    generator._finish_saving_model()
+    generator._save_model_in_background = False
+
     return H_o, persis_info, FINISHED_PERSISTENT_GEN_TAG
@@ -30,8 +30,12 @@ class AxGenerator(Generator):
         List of parameters to analyze at each trial, but which are not
         optimization objectives. By default ``None``.
     use_cuda : bool, optional
-        Whether to allow the generator to run on a CUDA GPU. By default
-        ``False``.
+        Whether to allow the generator to run on a CUDA GPU. If not given,
+        CUDA will be used whenever it is available. In that case, the
+        ``CUDA_VISIBLE_DEVICES`` environment variable will be set in the
+        process running the generator which, by default, is the process in
+        which the exploration is launched. Set ``use_cuda=False`` to prevent
+        this. By default ``None``.
     gpu_id : int, optional
         The ID of the GPU in which to run the generator. By default, ``0``.
     dedicated_resources : bool, optional
@@ -66,7 +70,7 @@ class AxGenerator(Generator):
         varying_parameters: List[VaryingParameter],
         objectives: List[Objective],
         analyzed_parameters: Optional[List[Parameter]] = None,
-        use_cuda: Optional[bool] = False,
+        use_cuda: Optional[bool] = None,
         gpu_id: Optional[int] = 0,
         dedicated_resources: Optional[bool] = False,
         save_model: Optional[bool] = False,
@@ -76,6 +80,9 @@ class AxGenerator(Generator):
         allow_fixed_parameters: Optional[bool] = False,
         allow_updating_parameters: Optional[bool] = False,
     ) -> None:
+        # By default, run on the GPU when CUDA is available.
+        if use_cuda is None:
+            use_cuda = torch.cuda.is_available()
         super().__init__(
             varying_parameters=varying_parameters,
             objectives=objectives,
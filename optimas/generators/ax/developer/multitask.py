@@ -64,8 +64,12 @@ class AxMultitaskGenerator(AxGenerator):
         List of parameters to analyze at each trial, but which are not
         optimization objectives. By default ``None``.
     use_cuda : bool, optional
-        Whether to allow the generator to run on a CUDA GPU. By default
-        ``False``.
+        Whether to allow the generator to run on a CUDA GPU. If not given,
+        CUDA will be used whenever it is available. In that case, the
+        ``CUDA_VISIBLE_DEVICES`` environment variable will be set in the
+        process running the generator which, by default, is the process in
+        which the exploration is launched. Set ``use_cuda=False`` to prevent
+        this. By default ``None``.
     gpu_id : int, optional
         The ID of the GPU in which to run the generator. By default, ``0``.
     dedicated_resources : bool, optional
@@ -91,7 +95,7 @@ class AxMultitaskGenerator(AxGenerator):
         lofi_task: Task,
         hifi_task: Task,
         analyzed_parameters: Optional[List[Parameter]] = None,
-        use_cuda: Optional[bool] = False,
+        use_cuda: Optional[bool] = None,
         gpu_id: Optional[int] = 0,
         dedicated_resources: Optional[bool] = False,
         save_model: Optional[bool] = True,
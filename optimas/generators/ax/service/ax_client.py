@@ -2,6 +2,8 @@
 
 from typing import List, Optional
 
+import torch
+
 from ax.service.ax_client import AxClient
 from ax.core.objective import MultiObjective
 
@@ -146,7 +148,11 @@ class AxClientGenerator(AxServiceGenerator):
     def _use_cuda(self, ax_client: AxClient):
         """Determine whether the AxClient uses CUDA."""
         for step in ax_client.generation_strategy._steps:
-            if "torch_device" in step.model_kwargs:
-                if step.model_kwargs["torch_device"] == "cuda":
-                    return True
+            if step.model_kwargs is None:
+                continue
+            device = step.model_kwargs.get("torch_device")
+            # The device can be given either as a string or as a
+            # `torch.device`, and can include a device index.
+            if device is not None and torch.device(device).type == "cuda":
+                return True
         return False
@@ -1,6 +1,8 @@
 """Contains the definition of the base Ax generator using the service API."""
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
+from concurrent.futures import ThreadPoolExecutor
+import json
 import os
 
 import torch
@@ -71,8 +73,12 @@ class AxServiceGenerator(AxGenerator):
         if the range of parameter has been reduced during the optimization.
         By default, False.
     use_cuda : bool, optional
-        Whether to allow the generator to run on a CUDA GPU. By default
-        ``False``.
+        Whether to allow the generator to run on a CUDA GPU. If not given,
+        CUDA will be used whenever it is available. In that case, the
+        ``CUDA_VISIBLE_DEVICES`` environment variable will be set in the
+        process running the generator which, by default, is the process in
+        which the exploration is launched. Set ``use_cuda=False`` to prevent
+        this. By default ``None``.
     gpu_id : int, optional
         The ID of the GPU in which to run the generator. By default, ``0``.
     dedicated_resources : bool, optional
@@ -88,6 +94,12 @@ class AxServiceGenerator(AxGenerator):
     model_history_dir : str, optional
         Name of the directory in which the model will be saved. By default,
         ``'model_history'``.
+    bo_precision : {'float64', 'float32'}, optional
+        Floating point precision of the Bayesian optimization model when
+        running on a CUDA GPU. Single precision can significantly speed up
+        the fitting of the model on GPUs with a low double-precision
+        throughput, at the cost of a lower numerical stability of the model.
+        On CPU, double precision is always used. By default ``'float64'``.
 
     """
 
@@ -102,13 +114,19 @@ class AxServiceGenerator(AxGenerator):
         enforce_n_init: Optional[bool] = False,
         abandon_failed_trials: Optional[bool] = True,
         fit_out_of_design: Optional[bool] = False,
-        use_cuda: Optional[bool] = False,
+        use_cuda: Optional[bool] = None,
         gpu_id: Optional[int] = 0,
         dedicated_resources: Optional[bool] = False,
         save_model: Optional[bool] = True,
         model_save_period: Optional[int] = 5,
         model_history_dir: Optional[str] = "model_history",
+        bo_precision: Literal["float64", "float32"] = "float64",
     ) -> None:
+        if bo_precision not in ["float64", "float32"]:
+            raise ValueError(
+                "`bo_precision` must be 'float64' or 'float32', "
+                f"not {bo_precision}."
+            )
         super().__init__(
             varying_parameters=varying_parameters,
             objectives=objectives,
@@ -126,9 +144,15 @@ class AxServiceGenerator(AxGenerator):
         self._enforce_n_init = enforce_n_init
         self._abandon_failed_trials = abandon_failed_trials
         self._fit_out_of_design = fit_out_of_design
+        self._bo_precision = bo_precision
         self._fixed_features = None
         self._parameter_constraints = parameter_constraints
         self._outcome_constraints = outcome_constraints
+        self._save_executor = None
+        self._save_future = None
+        # The names of the varying parameters do not change, even if the
+        # parameters are updated.
+        self._var_names = [var.name for var in self._varying_parameters]
         self._ax_client = self._create_ax_client()
         self._model = AxModelManager(self._ax_client)
 
@@ -144,22 +168,32 @@ class AxServiceGenerator(AxGenerator):
 
     def _ask(self, trials: List[Trial]) -> List[Trial]:
         """Fill in the parameter values of the requested trials."""
-        for trial in trials:
-            parameters, trial_id = self._ax_client.get_next_trial(
-                fixed_features=self._fixed_features
-            )
-            trial.parameter_values = [
-                parameters.get(var.name) for var in self._varying_parameters
-            ]
+        # Request all trials with a single call. Note that `get_next_trials`
+        # still generates the trials one at a time, i.e., they are not jointly
+        # optimized as a batch. If the Ax client cannot currently generate as
+        # many trials as requested (e.g., due to the generation limit of the
+        # current step or because the optimization is complete), the
+        # remaining ones are left empty and will be discarded by `ask`.
+        ax_trials, _ = self._ax_client.get_next_trials(
+            max_trials=len(trials), fixed_features=self._fixed_features
+        )
+        for trial, (trial_id, parameters) in zip(trials, ax_trials.items()):
+            trial.parameter_values = [parameters[n] for n in self._var_names]
             trial.ax_trial_id = trial_id
         return trials
 
     def _tell(self, trials: List[Trial]) -> None:
         """Incorporate evaluated trials into Ax client."""
+        # Get the names of the outcome constraints, if any.
+        ax_config = self._ax_client.experiment.optimization_config
+        ocs = frozenset(
+            oc.metric.name for oc in ax_config.outcome_constraints or []
+        )
+        # Number of completed trials that were given externally.
+        n_external_completed = 0
         for trial in trials:
             try:
                 trial_id = trial.ax_trial_id
-                ax_trial = self._ax_client.get_trial(trial_id)
             except AttributeError:
                 params = {}
                 for var, value in zip(
@@ -189,55 +223,64 @@ class AxServiceGenerator(AxGenerator):
                             continue
                     else:
                         raise error
-                ax_trial = self._ax_client.get_trial(trial_id)
 
-                # Since data was given externally, reduce number of
-                # initialization trials, but only if they have not failed.
-                if trial.completed and not self._enforce_n_init:
-                    generation_strategy = self._ax_client.generation_strategy
-                    current_step = generation_strategy.current_step
-                    # Reduce only if there are still Sobol trials left.
-                    if current_step.model == Models.SOBOL:
-                        for tc in current_step.transition_criteria:
-                            # Looping over all criterial makes sure we reduce
-                            # the transition thresholds due to `_n_init`
-                            # (i.e., max trials) and `min_trials_observed=1` (
-                            # i.e., min trials).
-                            if isinstance(tc, (MinTrials, MaxTrials)):
-                                tc.threshold -= 1
-                        generation_strategy._maybe_move_to_next_step()
+                if trial.completed:
+                    n_external_completed += 1
             finally:
                 if trial.ignored:
                     continue
                 elif trial.completed:
-                    outcome_evals = {}
                     # Add objective evaluations.
-                    for ev in trial.objective_evaluations:
-                        outcome_evals[ev.parameter.name] = (ev.value, ev.sem)
-                    # Add outcome constraints evaluations.
-                    ax_config = self._ax_client.experiment.optimization_config
-                    if ax_config.outcome_constraints:
-                        ocs = [
-                            oc.metric.name
-                            for oc in ax_config.outcome_constraints
-                        ]
-                        for ev in trial.parameter_evaluations:
-                            par_name = ev.parameter.name
-                            if par_name in ocs:
-                                outcome_evals[par_name] = (ev.value, ev.sem)
+                    outcome_evals = {
+                        ev.parameter.name: (ev.value, ev.sem)
+                        for ev in trial.objective_evaluations
+                    }
+                    # Add outcome constraints evaluations, if there are
+                    # constraints and the trial has analyzed parameters.
+                    if ocs and trial.analyzed_parameters:
+                        outcome_evals.update(
+                            (ev.parameter.name, (ev.value, ev.sem))
+                            for ev in trial.parameter_evaluations
+                            if ev.parameter.name in ocs
+                        )
                     self._ax_client.complete_trial(
                         trial_index=trial_id, raw_data=outcome_evals
                     )
                 elif trial.failed:
+                    # The Ax trial is only needed to mark it as failed.
+                    ax_trial = self._ax_client.get_trial(trial_id)
                     if self._abandon_failed_trials:
                         ax_trial.mark_abandoned()
                     else:
                         ax_trial.mark_failed()
 
+        # Since data was given externally, reduce number of initialization
+        # trials, but only by the number of external trials that have not
+        # failed. This is done at once for all the given trials.
+        if n_external_completed > 0 and not self._enforce_n_init:
+            generation_strategy = self._ax_client.generation_strategy
+            current_step = generation_strategy.current_step
+            # Reduce only if there are still Sobol trials left.
+            if current_step.model == Models.SOBOL:
+                for tc in current_step.transition_criteria:
+                    # Looping over all criterial makes sure we reduce
+                    # the transition thresholds due to `_n_init`
+                    # (i.e., max trials) and `min_trials_observed=1` (
+                    # i.e., min trials).
+                    if isinstance(tc, (MinTrials, MaxTrials)):
+                        tc.threshold -= n_external_completed
+                generation_strategy._maybe_move_to_next_step()
+
     def _create_ax_client(self) -> AxClient:
         """Create Ax client."""
+        # Single precision is only used on GPU, where it can be significantly
+        # faster than double precision.
+        if self.torch_device == "cuda" and self._bo_precision == "float32":
+            torch_dtype = torch.float32
+        else:
+            torch_dtype = torch.double
         bo_model_kwargs = {
-            "torch_dtype": torch.double,
+            "torch_dtype": torch_dtype,
             "torch_device": torch.device(self.torch_device),
             "fit_out_of_design": self._fit_out_of_design,
         }
@@ -258,13 +301,20 @@ class AxServiceGenerator(AxGenerator):
     def _create_ax_parameters(self) -> List:
         """Create list of parameters to pass to an Ax."""
         parameters = convert_optimas_to_ax_parameters(self.varying_parameters)
+        self._update_fixed_features()
+        return parameters
+
+    def _update_fixed_features(self) -> None:
+        """Store the fixed varying parameters as fixed features."""
         fixed_parameters = {}
         for var in self._varying_parameters:
             if var.is_fixed:
                 fixed_parameters[var.name] = var.default_value
-        # Store fixed parameters as fixed features.
-        self._fixed_features = FixedFeatures(fixed_parameters)
-        return parameters
+        # Avoid passing empty fixed features to Ax.
+        if fixed_parameters:
+            self._fixed_features = FixedFeatures(fixed_parameters)
+        else:
+            self._fixed_features = None
 
     def _create_ax_objectives(self) -> Dict[str, ObjectiveProperties]:
         """Create list of objectives to pass to an Ax."""
@@ -293,14 +343,66 @@ class AxServiceGenerator(AxGenerator):
         raise NotImplementedError
 
     def _save_model_to_file(self) -> None:
-        """Save Ax client to json file."""
-        file_path = os.path.join(
-            self._model_history_dir,
-            "ax_client_at_eval_{}.json".format(
-                self._n_evaluated_trials_last_saved
-            ),
+        """Save Ax client to json file.
+
+        The json snapshot of the client, which is the most expensive part of
+        saving it, is always created in the current thread. If
+        ``_save_model_in_background`` is ``True``, the snapshot is then
+        encoded and written to file in a separate thread, and at most one file
+        is written at any given time. Since encoding the snapshot holds the
+        GIL, this mainly avoids waiting for the file to be written; it does
+        not make the serialization run in parallel with the generator.
+        """
+        file_path = os.path.abspath(
+            os.path.join(
+                self._model_history_dir,
+                "ax_client_at_eval_{}.json".format(
+                    self._n_evaluated_trials_last_saved
+                ),
+            )
         )
-        self._ax_client.save_to_json_file(file_path)
+        snapshot = self._ax_client.to_json_snapshot()
+        if not self._save_model_in_background:
+            _write_json_file(snapshot, file_path)
+            return
+        # Wait until the previous file has been written.
+        if self._save_future is not None:
+            self._save_future.result()
+        if self._save_executor is None:
+            self._save_executor = ThreadPoolExecutor(max_workers=1)
+        self._save_future = self._save_executor.submit(
+            _write_json_file, snapshot, file_path
+        )
+
+    def _finish_saving_model(self) -> None:
+        """Wait until the last Ax client has been written to file.
+
+        The thread used for writing the file is shut down afterwards. Any
+        exception that occurred while writing the file is raised here.
+        """
+        try:
+            if self._save_future is not None:
+                self._save_future.result()
+        finally:
+            self._save_future = None
+            if self._save_executor is not None:
+                self._save_executor.shutdown()
+                self._save_executor = None
+
+    def _prepare_to_send(self) -> None:
+        """Delete the fitted models before sending the generator.
+
+        The fitted models can be large and contain tensors allocated on the
+        GPU. There is no need to send them, since the generation strategy
+        refits the current model before generating new trials.
+        """
+        generation_strategy = self._ax_client.generation_strategy
+        for step in generation_strategy._steps:
+            step.model_spec._fitted_model = None
+        generation_strategy._model = None
+        # The executor cannot be sent to other processes. A new one will be
+        # created the next time the model is saved in the background.
+        self._finish_saving_model()
 
     def _update_parameter(self, parameter):
         """Update a parameter from the search space."""
@@ -309,7 +411,10 @@ class AxServiceGenerator(AxGenerator):
         generation_strategy = self._ax_client.generation_strategy
         if generation_strategy._model is not None:
             del generation_strategy._curr.model_spec._fitted_model
-        parameters = self._create_ax_parameters()
+        # Convert only the updated parameter, but refresh the fixed features
+        # in case the parameter has been fixed or released.
+        parameters = convert_optimas_to_ax_parameters([parameter])
+        self._update_fixed_features()
         new_search_space = InstantiationBase.make_search_space(parameters, None)
         self._ax_client.experiment.search_space.update_parameter(
             new_search_space.parameters[parameter.name]
@@ -322,3 +427,9 @@ class AxServiceGenerator(AxGenerator):
             ax_trial.mark_abandoned(unsafe=True)
         else:
             ax_trial.mark_failed(unsafe=True)
+
+
+def _write_json_file(snapshot: Dict, file_path: str) -> None:
+    """Write the json snapshot of an Ax client to file."""
+    with open(file_path, "w+") as file:
+        file.write(json.dumps(snapshot))
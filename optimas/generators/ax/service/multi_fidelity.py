@@ -1,6 +1,6 @@
 """Contains the definition of the multi-fidelity Ax generator."""
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
 
 from botorch.acquisition.knowledge_gradient import (
     qMultiFidelityKnowledgeGradient,
@@ -50,8 +50,12 @@ class AxMultiFidelityGenerator(AxServiceGenerator):
         `cost_intercept + n`, where `n` is the number of generated points.
         Used for the knowledge gradient acquisition function. By default, 1.
     use_cuda : bool, optional
-        Whether to allow the generator to run on a CUDA GPU. By default
-        ``False``.
+        Whether to allow the generator to run on a CUDA GPU. If not given,
+        CUDA will be used whenever it is available. In that case, the
+        ``CUDA_VISIBLE_DEVICES`` environment variable will be set in the
+        process running the generator which, by default, is the process in
+        which the exploration is launched. Set ``use_cuda=False`` to prevent
+        this. By default ``None``.
     gpu_id : int, optional
         The ID of the GPU in which to run the generator. By default, ``0``.
     dedicated_resources : bool, optional
@@ -67,6 +71,12 @@ class AxMultiFidelityGenerator(AxServiceGenerator):
     model_history_dir : str, optional
         Name of the directory in which the model will be saved. By default,
         ``'model_history'``.
+    bo_precision : {'float64', 'float32'}, optional
+        Floating point precision of the Bayesian optimization model when
+        running on a CUDA GPU. Single precision can significantly speed up
+        the fitting of the model on GPUs with a low double-precision
+        throughput, at the cost of a lower numerical stability of the model.
+        On CPU, double precision is always used. By default ``'float64'``.
 
     """
 
@@ -81,12 +91,13 @@ class AxMultiFidelityGenerator(AxServiceGenerator):
         abandon_failed_trials: Optional[bool] = True,
         fit_out_of_design: Optional[bool] = False,
         fidel_cost_intercept: Optional[float] = 1.0,
-        use_cuda: Optional[bool] = False,
+        use_cuda: Optional[bool] = None,
         gpu_id: Optional[int] = 0,
         dedicated_resources: Optional[bool] = False,
         save_model: Optional[bool] = True,
         model_save_period: Optional[int] = 5,
         model_history_dir: Optional[str] = "model_history",
+        bo_precision: Literal["float64", "float32"] = "float64",
     ) -> None:
         self.fidel_cost_intercept = fidel_cost_intercept
         super().__init__(
@@ -104,6 +115,7 @@ class AxMultiFidelityGenerator(AxServiceGenerator):
             save_model=save_model,
             model_save_period=model_save_period,
             model_history_dir=model_history_dir,
+            bo_precision=bo_precision,
         )
 
     def _create_generation_steps(
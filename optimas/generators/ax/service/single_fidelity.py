@@ -1,6 +1,6 @@
 """Contains the definition of the single-fidelity Ax generator."""
 
-from typing import List, Optional, Dict
+from typing import List, Optional, Dict, Literal
 
 from ax.modelbridge.generation_strategy import GenerationStep
 from ax.modelbridge.registry import Models
@@ -64,8 +64,12 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
         approach is specially well suited for high-dimensional optimization.
         By default ``False``.
     use_cuda : bool, optional
-        Whether to allow the generator to run on a CUDA GPU. By default
-        ``False``.
+        Whether to allow the generator to run on a CUDA GPU. If not given,
+        CUDA will be used whenever it is available. In that case, the
+        ``CUDA_VISIBLE_DEVICES`` environment variable will be set in the
+        process running the generator which, by default, is the process in
+        which the exploration is launched. Set ``use_cuda=False`` to prevent
+        this. By default ``None``.
     gpu_id : int, optional
         The ID of the GPU in which to run the generator. By default, ``0``.
     dedicated_resources : bool, optional
@@ -81,6 +85,12 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
     model_history_dir : str, optional
         Name of the directory in which the model will be saved. By default,
         ``'model_history'``.
+    bo_precision : {'float64', 'float32'}, optional
+        Floating point precision of the Bayesian optimization model when
+        running on a CUDA GPU. Single precision can significantly speed up
+        the fitting of the model on GPUs with a low double-precision
+        throughput, at the cost of a lower numerical stability of the model.
+        On CPU, double precision is always used. By default ``'float64'``.
 
     References
     ----------
@@ -103,12 +113,13 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
         abandon_failed_trials: Optional[bool] = True,
         fit_out_of_design: Optional[bool] = False,
         fully_bayesian: Optional[bool] = False,
-        use_cuda: Optional[bool] = False,
+        use_cuda: Optional[bool] = None,
         gpu_id: Optional[int] = 0,
         dedicated_resources: Optional[bool] = False,
         save_model: Optional[bool] = True,
         model_save_period: Optional[int] = 5,
         model_history_dir: Optional[str] = "model_history",
+        bo_precision: Literal["float64", "float32"] = "float64",
     ) -> None:
         self._fully_bayesian = fully_bayesian
         super().__init__(
@@ -127,6 +138,7 @@ class AxSingleFidelityGenerator(AxServiceGenerator):
             save_model=save_model,
             model_save_period=model_save_period,
             model_history_dir=model_history_dir,
+            bo_precision=bo_precision,
         )
 
     def _create_generation_steps(
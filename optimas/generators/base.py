@@ -101,6 +101,7 @@ class Generator:
         self._model_save_period = model_save_period
         self._model_history_dir = model_history_dir
         self._n_evaluated_trials_last_saved = 0
+        self._save_model_in_background = False
         self._use_cuda = use_cuda
         self._gpu_id = gpu_id
         self._dedicated_resources = dedicated_resources
@@ -515,11 +516,19 @@ class Generator:
             if not os.path.exists(self._model_history_dir):
                 os.mkdir(self._model_history_dir)
             self._save_model_to_file()
-            logger.info(
-                "Saved model to file after {} evaluated trials.".format(
-                    self.n_evaluated_trials
+            if self._save_model_in_background:
+                logger.info(
+                    "Started saving model to file after {} evaluated "
+                    "trials.".format(self.n_evaluated_trials)
+                )
+            else:
+                # Make sure that the file has been written before returning.
+                self._finish_saving_model()
+                logger.info(
+                    "Saved model to file after {} evaluated trials.".format(
+                        self.n_evaluated_trials
+                    )
                 )
-            )
 
     def get_gen_specs(
         self, sim_workers: int, run_params: Dict, max_evals: int
@@ -609,6 +618,25 @@ class Generator:
         """Save model method to be implemented by the Generator subclasses."""
         pass
 
+    def _finish_saving_model(self) -> None:
+        """Wait until the model has been saved to file.
+
+        This method should be implemented by the Generator subclasses that,
+        when ``_save_model_in_background`` is ``True``, save the model
+        asynchronously. It should also release any resources used for saving
+        the model in the background.
+        """
+        pass
+
+    def _prepare_to_send(self) -> None:
+        """Prepare the generator to be sent to another process.
+
+        This method can be implemented by the Generator subclasses to remove
+        any data that is not needed (or is expensive to serialize) from the
+        generator before it is copied to the libEnsemble workers.
+        """
+        pass
+
     def _update_parameter(self, parameter: VaryingParameter):
         """Perform the operations needed by to update the parameter.
 
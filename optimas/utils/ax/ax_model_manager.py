@@ -1,15 +1,27 @@
 """Contains the definition of the AxModelManager class."""
 
-from typing import Optional, Union, List, Tuple, Dict, Any, Literal
+from __future__ import annotations
+from typing import (
+    TYPE_CHECKING,
+    Optional,
+    Union,
+    List,
+    Tuple,
+    Dict,
+    Any,
+    Literal,
+)
 
 import numpy as np
 from numpy.typing import NDArray
 import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.figure import Figure
-from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec, SubplotSpec
-from matplotlib.axes import Axes
-from mpl_toolkits.axes_grid1 import make_axes_locatable
+
+# Matplotlib is only imported when plotting. This avoids the import overhead
+# in processes that only use the model (e.g., the generator).
+if TYPE_CHECKING:
+    from matplotlib.figure import Figure
+    from matplotlib.gridspec import SubplotSpec
+    from matplotlib.axes import Axes
 
 # Ax utilities for model building
 try:
@@ -21,6 +33,7 @@ try:
     from ax.modelbridge.registry import Models
     from ax.modelbridge.torch import TorchModelBridge
     from ax.core.observation import ObservationFeatures
+    from ax.core.base_trial import TrialStatus
     from .other import (
         convert_optimas_to_ax_parameters,
         convert_optimas_to_ax_objectives,
@@ -88,13 +101,31 @@ class AxModelManager:
                 "The source must be an `AxClient`, a path to an AxClient json "
                 "file, or a pandas `DataFrame`."
             )
+        # Model and indices of the completed trials at the time of the last
+        # fit.
+        self._fitted_model = None
+        self._completed_trials_at_fit = None
 
     @property
     def _model(self) -> TorchModelBridge:
         """Get the model from the AxClient instance."""
-        # Make sure model is fitted.
-        self.ax_client.fit_model()
-        return self.ax_client.generation_strategy.model
+        # Make sure model is fitted. Refitting is skipped if the model has
+        # not changed and the set of completed trials is the same as in the
+        # last fit (i.e., no trial has been completed or marked as failed).
+        experiment = self.ax_client.experiment
+        completed_trials = frozenset(
+            experiment.trial_indices_by_status[TrialStatus.COMPLETED]
+        )
+        model = self.ax_client.generation_strategy.model
+        if (
+            model is None
+            or model is not self._fitted_model
+            or completed_trials != self._completed_trials_at_fit
+        ):
+            self.ax_client.fit_model()
+            self._fitted_model = self.ax_client.generation_strategy.model
+            self._completed_trials_at_fit = completed_trials
+        return self._fitted_model
 
     def _build_ax_client_from_dataframe(
         self,
@@ -326,12 +357,16 @@ class AxModelManager:
             pp = self.ax_client.get_pareto_optimal_parameters(
                 use_model_predictions=use_model_predictions
             )
-            obj_vals, param_vals, trial_indices = [], [], []
-            for index, (vals, (objs, covs)) in pp.items():
-                trial_indices.append(index)
-                param_vals.append(vals)
-                obj_vals.append(objs[metric_name])
-            i_best = np.argmin(obj_vals) if minimize else np.argmax(obj_vals)
+            # Unpack the trial indices, parameters and values of the metric
+            # in a single pass over the Pareto front.
+            trial_indices, param_vals, obj_vals = zip(
+                *(
+                    (index, vals, objs[metric_name])
+                    for index, (vals, (objs, _)) in pp.items()
+                )
+            )
+            select_best = min if minimize else max
+            i_best = select_best(range(len(obj_vals)), key=obj_vals.__getitem__)
             best_point = param_vals[i_best]
             index = trial_indices[i_best]
         else:
@@ -420,6 +455,10 @@ class AxModelManager:
             A matplotlib figure and either a single ``Axes`` or a list of
             ``Axes`` if ``mode="both"``.
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
+        from mpl_toolkits.axes_grid1 import make_axes_locatable
+
         # get experiment info
         experiment = self.ax_client.experiment
         parnames = list(experiment.parameters.keys())
@@ -591,6 +630,9 @@ class AxModelManager:
         -------
         Figure, Axes
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
+
         # get experiment info
         experiment = self.ax_client.experiment
         parnames = list(experiment.parameters.keys())
@@ -695,6 +737,9 @@ class AxModelManager:
         -------
         Figure, Axes
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
+
         # Get metric name.
         if metric_name is None:
             metric_name = self.ax_client.objective_names[0]
@@ -767,6 +812,9 @@ class AxModelManager:
         -------
         Figure, Axes
         """
+        import matplotlib.pyplot as plt
+        from matplotlib.gridspec import GridSpec, GridSpecFromSubplotSpec
+
         # Get metric name.
         if metric_name is None:
             metric_name = self.ax_client.objective_names[0]
@@ -8,6 +8,10 @@ from ax.service.utils.instantiation import ObjectiveProperties
 from optimas.core import VaryingParameter, Objective
 
 
+# Ax value type corresponding to each numpy dtype kind.
+AX_VALUE_TYPES = {"f": "float", "i": "int"}
+
+
 def convert_optimas_to_ax_parameters(
     varying_parameters: List[VaryingParameter],
 ) -> List[Dict]:
@@ -15,14 +19,10 @@ def convert_optimas_to_ax_parameters(
     parameters = []
     for var in varying_parameters:
         # Determine parameter type.
-        value_dtype = np.dtype(var.dtype)
-        if value_dtype.kind == "f":
-            value_type = "float"
-        elif value_dtype.kind == "i":
-            value_type = "int"
-        else:
+        value_type = AX_VALUE_TYPES.get(np.dtype(var.dtype).kind)
+        if value_type is None:
             raise ValueError(
-                "Ax range parameter can only be of type 'float'ot 'int', "
+                "Ax range parameter can only be of type 'float' or 'int', "
                 f"not {var.dtype}."
             )
         # Create parameter dict and append to list.
@@ -2,8 +2,16 @@ import os
 import threading
 
 import numpy as np
+import pytest
+import torch
 
 from ax.service.ax_client import AxClient, ObjectiveProperties
+from ax.modelbridge.generation_strategy import (
+    GenerationStep,
+    GenerationStrategy,
+)
+from ax.modelbridge.registry import Models
+from ax.modelbridge.transition_criterion import MaxTrials
 from ax.utils.measurement.synthetic_functions import hartmann6
 
 from optimas.explorations import Exploration
@@ -14,7 +22,13 @@ from optimas.generators import (
     AxClientGenerator,
 )
 from optimas.evaluators import FunctionEvaluator, MultitaskEvaluator
-from optimas.core import VaryingParameter, Objective, Task, Parameter
+from optimas.core import (
+    VaryingParameter,
+    Objective,
+    Task,
+    Parameter,
+    Evaluation,
+)
 
 
 # Some tests will use threading (instead of multiprocessing) to be able to
@@ -116,6 +130,22 @@ def eval_func_task_2(input_params, output_params):
     output_params["f"] = result
 
 
+def create_ax_client(steps):
+    """Create a 2D AxClient with the given generation steps."""
+    ax_client = AxClient(
+        generation_strategy=GenerationStrategy(steps),
+        verbose_logging=False,
+    )
+    ax_client.create_experiment(
+        parameters=[
+            {"name": "x0", "type": "range", "bounds": [0.0, 1.0]},
+            {"name": "x1", "type": "range", "bounds": [0.0, 1.0]},
+        ],
+        objectives={"f": ObjectiveProperties(minimize=False)},
+    )
+    return ax_client
+
+
 def make_plots(gen):
     """Make plots with Service API generators."""
     gen.model.plot_contour()
@@ -654,6 +684,275 @@ def test_ax_client():
     make_plots(gen)
 
 
+def test_ax_client_generation_limit():
+    """
+    Test that asking for more trials than the AxClient can currently generate
+    returns only the available trials instead of failing.
+    """
+    ax_client = create_ax_client(
+        [GenerationStep(model=Models.SOBOL, num_trials=2)]
+    )
+    gen = AxClientGenerator(ax_client=ax_client, save_model=False)
+
+    # Only 2 trials can be generated in total.
+    trials = gen.ask(3)
+    assert len(trials) == 2
+    for trial in trials:
+        assert len(trial.parameter_values) == 2
+    assert len(gen.ask(1)) == 0
+    assert len(ax_client.experiment.trials) == 2
+
+
+def test_ax_client_use_cuda():
+    """
+    Test that the use of CUDA is correctly determined from the generation
+    steps of a user-given AxClient.
+    """
+    model_kwargs_and_use_cuda = [
+        ({"torch_device": torch.device("cuda:1")}, True),
+        ({"torch_device": "cuda"}, True),
+        ({"torch_device": "cpu"}, False),
+        ({"torch_device": None}, False),
+        ({}, False),
+        (None, False),
+    ]
+    for model_kwargs, use_cuda in model_kwargs_and_use_cuda:
+        ax_client = create_ax_client(
+            [
+                GenerationStep(model=Models.SOBOL, num_trials=2),
+                GenerationStep(
+                    model=Models.BOTORCH_MODULAR,
+                    num_trials=-1,
+                    model_kwargs=model_kwargs,
+                ),
+            ]
+        )
+        gen = AxClientGenerator(ax_client=ax_client, save_model=False)
+        assert gen.use_cuda == use_cuda
+
+
+def test_ax_use_cuda_default(monkeypatch):
+    """
+    Test that, by default, the generators use CUDA only if it is available.
+    """
+    var1 = VaryingParameter("x0", -50.0, 5.0)
+    var2 = VaryingParameter("x1", -5.0, 15.0)
+    obj = Objective("f", minimize=False)
+    for cuda_available in [True, False]:
+        monkeypatch.setattr(torch.cuda, "is_available", lambda: cuda_available)
+        gen = AxSingleFidelityGenerator(
+            varying_parameters=[var1, var2], objectives=[obj]
+        )
+        assert gen.use_cuda == cuda_available
+        assert gen.torch_device == ("cuda" if cuda_available else "cpu")
+        # An explicit value takes precedence.
+        gen = AxSingleFidelityGenerator(
+            varying_parameters=[var1, var2], objectives=[obj], use_cuda=False
+        )
+        assert not gen.use_cuda
+        assert gen.torch_device == "cpu"
+
+
+def test_ax_bo_precision(monkeypatch):
+    """
+    Test that the `bo_precision` of the generators is validated and only
+    used when running on CUDA.
+    """
+    var1 = VaryingParameter("x0", -50.0, 5.0)
+    var2 = VaryingParameter("x1", -5.0, 15.0)
+    var3 = VaryingParameter(
+        "res", 1.0, 8.0, is_fidelity=True, fidelity_target_value=8.0
+    )
+    obj = Objective("f", minimize=False)
+
+    def get_bo_torch_dtype(gen):
+        return gen.ax_client.generation_strategy._steps[-1].model_kwargs[
+            "torch_dtype"
+        ]
+
+    for cuda_available in [False, True]:
+        monkeypatch.setattr(torch.cuda, "is_available", lambda: cuda_available)
+        for bo_precision in ["float64", "float32"]:
+            gen_sf = AxSingleFidelityGenerator(
+                varying_parameters=[var1, var2],
+                objectives=[obj],
+                bo_precision=bo_precision,
+            )
+            gen_mf = AxMultiFidelityGenerator(
+                varying_parameters=[var1, var2, var3],
+                objectives=[obj],
+                bo_precision=bo_precision,
+            )
+            if cuda_available and bo_precision == "float32":
+                expected_dtype = torch.float32
+            else:
+                expected_dtype = torch.double
+            assert get_bo_torch_dtype(gen_sf) == expected_dtype
+            assert get_bo_torch_dtype(gen_mf) == expected_dtype
+
+    for bo_precision in ["float16", None]:
+        with pytest.raises(ValueError):
+            AxSingleFidelityGenerator(
+                varying_parameters=[var1, var2],
+                objectives=[obj],
+                bo_precision=bo_precision,
+            )
+
+
+def test_ax_prepare_to_send():
+    """
+    Test that the fitted models are removed before sending the generator
+    to the workers and that new trials can still be generated afterwards.
+    """
+    var1 = VaryingParameter("x0", -50.0, 5.0)
+    var2 = VaryingParameter("x1", -5.0, 15.0)
+    obj = Objective("f", minimize=False)
+    gen = AxSingleFidelityGenerator(
+        varying_parameters=[var1, var2],
+        objectives=[obj],
+        n_init=2,
+        save_model=False,
+    )
+
+    # Evaluate some trials so that the BO model gets fitted.
+    for _ in range(3):
+        trial = gen.ask(1)[0]
+        x0, x1 = trial.parameter_values
+        result = -(x0 + 10 * np.cos(x0)) * (x1 + 5 * np.cos(x1))
+        trial.complete_evaluation(Evaluation(parameter=obj, value=result))
+        gen.tell([trial])
+    generation_strategy = gen.ax_client.generation_strategy
+    assert generation_strategy.model is not None
+
+    gen._prepare_to_send()
+    for step in generation_strategy._steps:
+        assert step.model_spec._fitted_model is None
+    assert generation_strategy.model is None
+
+    # Check that the model is refitted when asking for new trials.
+    trials = gen.ask(2)
+    assert len(trials) == 2
+    assert generation_strategy.model is not None
+
+
+def test_ax_save_model(monkeypatch):
+    """
+    Test that the AxClient is saved to file both when saving in the
+    background and when not, and that errors while writing the file in
+    the background are raised.
+    """
+    var1 = VaryingParameter("x0", -50.0, 5.0)
+    var2 = VaryingParameter("x1", -5.0, 15.0)
+    obj = Objective("f", minimize=False)
+    model_history_dir = "./tests_output/test_ax_save_model/model_history"
+    os.makedirs(os.path.dirname(model_history_dir), exist_ok=True)
+    gen = AxSingleFidelityGenerator(
+        varying_parameters=[var1, var2],
+        objectives=[obj],
+        n_init=2,
+        model_save_period=1,
+        model_history_dir=model_history_dir,
+    )
+
+    def ask_and_tell():
+        trial = gen.ask(1)[0]
+        x0, x1 = trial.parameter_values
+        result = -(x0 + 10 * np.cos(x0)) * (x1 + 5 * np.cos(x1))
+        trial.complete_evaluation(Evaluation(parameter=obj, value=result))
+        gen.tell([trial])
+
+    def get_file_path(n_evals):
+        return os.path.join(
+            model_history_dir, f"ax_client_at_eval_{n_evals}.json"
+        )
+
+    # By default, the file is written before `tell` returns.
+    ask_and_tell()
+    AxClient.load_from_json_file(filepath=get_file_path(1))
+    assert gen._save_executor is None
+
+    # When saving in the background, the files are written by a separate
+    # thread, which is shut down by `_finish_saving_model`.
+    gen._save_model_in_background = True
+    ask_and_tell()
+    ask_and_tell()
+    assert gen._save_executor is not None
+    gen._finish_saving_model()
+    assert gen._save_executor is None
+    for n_evals in [2, 3]:
+        AxClient.load_from_json_file(filepath=get_file_path(n_evals))
+
+    # Errors while writing the file are raised by `_finish_saving_model`.
+    def failing_write_json_file(snapshot, file_path):
+        raise OSError("Could not write file.")
+
+    monkeypatch.setattr(
+        "optimas.generators.ax.service.base._write_json_file",
+        failing_write_json_file,
+    )
+    ask_and_tell()
+    with pytest.raises(OSError, match="Could not write file."):
+        gen._finish_saving_model()
+    assert gen._save_executor is None
+    assert not os.path.exists(get_file_path(4))
+
+
+def test_ax_save_model_exploration():
+    """
+    Test that, when running an exploration, the model is saved in the
+    background and written to file before the exploration finishes.
+    """
+    # Prevent trials from failing in this test.
+    global trial_count
+    global trials_to_fail
+    trial_count = 0
+    trials_to_fail = []
+
+    var1 = VaryingParameter("x0", -50.0, 5.0)
+    var2 = VaryingParameter("x1", -5.0, 15.0)
+    obj = Objective("f", minimize=False)
+    gen = AxSingleFidelityGenerator(
+        varying_parameters=[var1, var2],
+        objectives=[obj],
+        n_init=2,
+        model_save_period=2,
+    )
+    saved_in_background = []
+    save_model_to_file = gen._save_model_to_file
+
+    def recording_save_model_to_file():
+        saved_in_background.append(gen._save_model_in_background)
+        save_model_to_file()
+
+    gen._save_model_to_file = recording_save_model_to_file
+    ev = FunctionEvaluator(function=eval_func_sf)
+    exploration = Exploration(
+        generator=gen,
+        evaluator=ev,
+        max_evals=4,
+        sim_workers=2,
+        run_async=False,
+        exploration_dir_path="./tests_output/test_ax_save_model_exploration",
+        libe_comms="local_threading",
+    )
+    exploration.run()
+
+    # All models have been saved in the background.
+    assert saved_in_background == [True, True]
+    # After the exploration, the files have been written, the executor
+    # has been shut down and the background saving is disabled.
+    assert gen._save_executor is None
+    assert not gen._save_model_in_background
+    for n_evals in [2, 4]:
+        AxClient.load_from_json_file(
+            filepath=os.path.join(
+                exploration.exploration_dir_path,
+                "model_history",
+                f"ax_client_at_eval_{n_evals}.json",
+            )
+        )
+
+
 def test_ax_single_fidelity_with_history():
     """
     Test that an exploration with a single-fidelity generator runs when
@@ -872,6 +1171,62 @@ def test_ax_service_init():
         assert df["generation_method"][k] == "Sobol"
     df["generation_method"][n_external + n_init] == "GPEI"
 
+    # Test attaching several external evaluations, which are given to the
+    # generator in a single `tell`, both with fewer and more evaluations
+    # than `n_init`.
+    n_init = 4
+    for n_external in [2, 6]:
+        gen = AxSingleFidelityGenerator(
+            varying_parameters=[var1, var2], objectives=[obj], n_init=n_init
+        )
+        ev = FunctionEvaluator(function=eval_func_sf)
+        exploration = Exploration(
+            generator=gen,
+            evaluator=ev,
+            max_evals=6,
+            sim_workers=3,
+            exploration_dir_path=(
+                f"./tests_output/test_ax_service_init_attach_{n_external}"
+            ),
+        )
+
+        # Get reference to AxClient.
+        ax_client = gen._ax_client
+
+        x0 = -2.0 + np.random.rand(n_external)
+        x1 = 2.7 + np.random.rand(n_external)
+        exploration.attach_evaluations(
+            {
+                "x0": x0,
+                "x1": x1,
+                "f": -(x0 + 10 * np.cos(x0)) * (x1 + 5 * np.cos(x1)),
+            }
+        )
+
+        # Check that the Sobol step has been reduced by `n_external` trials,
+        # or skipped if `n_external >= n_init`.
+        n_sobol = max(n_init - n_external, 0)
+        current_step = ax_client.generation_strategy.current_step
+        if n_sobol > 0:
+            assert current_step.model == Models.SOBOL
+            for tc in current_step.transition_criteria:
+                if isinstance(tc, MaxTrials):
+                    assert tc.threshold == n_sobol
+        else:
+            assert current_step.model != Models.SOBOL
+
+        # Run exploration.
+        exploration.run()
+
+        # Check that the expected number of SOBOL trials has been generated.
+        df = ax_client.get_trials_data_frame()
+        for j in range(n_external):
+            assert df["generation_method"][j] == "Manual"
+        for k in range(n_external, n_external + n_sobol):
+            assert df["generation_method"][k] == "Sobol"
+        for k in range(n_external + n_sobol, len(df)):
+            assert df["generation_method"][k] not in ["Manual", "Sobol"]
+
 
 if __name__ == "__main__":
     test_ax_single_fidelity()
@@ -884,6 +1239,10 @@ if __name__ == "__main__":
     test_ax_multi_fidelity()
     test_ax_multitask()
     test_ax_client()
+    test_ax_client_generation_limit()
+    test_ax_client_use_cuda()
+    test_ax_prepare_to_send()
+    test_ax_save_model_exploration()
     test_ax_single_fidelity_with_history()
     test_ax_multi_fidelity_with_history()
     test_ax_multitask_with_history()
@@ -4,7 +4,7 @@ import matplotlib.pyplot as plt
 from matplotlib.gridspec import GridSpec
 
 from optimas.explorations import Exploration
-from optimas.core import VaryingParameter, Objective
+from optimas.core import VaryingParameter, Objective, Evaluation
 from optimas.generators import AxSingleFidelityGenerator
 from optimas.evaluators import FunctionEvaluator
 from optimas.diagnostics import ExplorationDiagnostics
@@ -159,5 +159,76 @@ def test_ax_model_manager():
     fig.savefig(os.path.join(exploration_dir_path, "feature_importance.png"))
 
 
+def test_ax_model_manager_refit():
+    """
+    Test that the model of an `AxModelManager` is refitted only when the
+    data of the Ax client changes, including when a completed trial is
+    later marked as failed.
+    """
+
+    var1 = VaryingParameter("x0", -50.0, 5.0)
+    var2 = VaryingParameter("x1", -5.0, 15.0)
+    obj = Objective("f", minimize=False)
+
+    gen = AxSingleFidelityGenerator(
+        varying_parameters=[var1, var2],
+        objectives=[obj],
+        n_init=2,
+        save_model=False,
+    )
+    ax_client = gen.ax_client
+
+    def get_result(x0, x1):
+        return -(x0 + 10 * np.cos(x0)) * (x1 + 5 * np.cos(x1))
+
+    def complete_external_trial(x0, x1):
+        _, trial_index = ax_client.attach_trial({"x0": x0, "x1": x1})
+        ax_client.complete_trial(
+            trial_index, raw_data={"f": (get_result(x0, x1), np.nan)}
+        )
+
+    trials = []
+    for _ in range(6):
+        trial = gen.ask(1)[0]
+        result = get_result(*trial.parameter_values)
+        trial.complete_evaluation(Evaluation(parameter=obj, value=result))
+        gen.tell([trial])
+        trials.append(trial)
+
+    # Count the number of times the model is fitted.
+    n_fits = 0
+    fit_model = ax_client.fit_model
+
+    def counting_fit_model():
+        nonlocal n_fits
+        n_fits += 1
+        fit_model()
+
+    ax_client.fit_model = counting_fit_model
+
+    mm = AxModelManager(source=ax_client)
+    mm._model
+    assert n_fits == 1
+
+    # Without new data, the model is not refitted.
+    mm._model
+    assert n_fits == 1
+
+    # Completing a new trial triggers a refit.
+    complete_external_trial(-2.0, 3.0)
+    mm._model
+    assert n_fits == 2
+
+    # Failing a completed trial and completing a new one keeps the number
+    # of completed trials, but the data changes, so the model is refitted.
+    gen.mark_trial_as_failed(trials[0].index)
+    complete_external_trial(-1.0, 4.0)
+    mm._model
+    assert n_fits == 3
+    mm._model
+    assert n_fits == 3
+
+
 if __name__ == "__main__":
     test_ax_model_manager()
+    test_ax_model_manager_refit()